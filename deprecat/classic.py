@@ -7,7 +7,7 @@ Classic ``@deprecat`` decorator to deprecate python classes, functions, methods
 """
 import functools
 import inspect
-import platform
+import sys
 import warnings
 
 import wrapt
@@ -22,7 +22,7 @@ try:
     _class_stacklevel = 2
 except ImportError:
     _routine_stacklevel = 3
-    if platform.python_implementation() == "PyPy":
+    if sys.implementation.name == "pypy":
         _class_stacklevel = 2
     else:
         _class_stacklevel = 3
@@ -30,6 +30,52 @@ except ImportError:
 string_types = (type(b''), type(u''))
 
 
+def _filters_force_ignore(category):
+    """
+    Best-effort check whether the current global warning filters unconditionally
+    discard *category*. Only a leading "ignore" entry without message, module or
+    line constraints counts; anything ambiguous returns False so the warning is
+    still emitted through the normal machinery.
+    """
+    for action, msg, cat, module, lineno in warnings.filters:
+        if not issubclass(category, cat):
+            continue
+        if msg is not None or lineno != 0:
+            return False
+        if module is not None and module != "":
+            return False
+        return action == "ignore"
+    return False
+
+
+class _IgnoreCache(object):
+    """
+    Remembers whether the global warning filters force-ignore a category, so a
+    wrapper can skip building and emitting a warning that would be discarded
+    anyway. The cached answer is recomputed whenever the filter list looks
+    different (new list object, different length, or a different head entry).
+    """
+
+    __slots__ = ("category", "_filters", "_length", "_head", "_ignored")
+
+    def __init__(self, category):
+        self.category = category
+        self._filters = None
+        self._length = -1
+        self._head = None
+        self._ignored = False
+
+    def __call__(self):
+        filters = warnings.filters
+        head = filters[0] if filters else None
+        if filters is not self._filters or len(filters) != self._length or head is not self._head:
+            self._filters = filters
+            self._length = len(filters)
+            self._head = head
+            self._ignored = _filters_force_ignore(self.category)
+        return self._ignored
+
+
 class ClassicAdapter(wrapt.AdapterFactory):
     """
     Classic adapter is used to get the deprecation message according to the wrapped object type:
@@ -64,14 +110,106 @@ class ClassicAdapter(wrapt.AdapterFactory):
     """
 
     def __init__(self, reason="", version="", remove_version="", action=None, deprecated_args=None, category=DeprecationWarning):
+        # Note: an empty dict is not folded into None. ``deprecated_args={}``
+        # selects the per-argument machinery with nothing to warn about (so no
+        # warning is ever emitted), whereas None deprecates the whole callable.
         self.reason = reason
         self.version = version
         self.remove_version = remove_version
         self.action = action
         self.category = category
         self.deprecated_args = deprecated_args
+        # The reason/version/remove_version parts of the message never change for
+        # a given adapter, so the full templates are built once here and the only
+        # work left per call is substituting the wrapped object's name.
+        suffix = ""
+        if reason != "":
+            suffix += " ({})".format(reason)
+        if version != "":
+            suffix += "\n-- Deprecated since version {}.".format(version)
+        if remove_version != "":
+            suffix += "\n-- Will be removed in version {}.".format(remove_version)
+        # Templates keyed by (instance is None, wrapped or instance is a class).
+        self._templates = {
+            (True, True): "Call to deprecated class {name}." + suffix,
+            (True, False): "Call to deprecated function (or staticmethod) {name}." + suffix,
+            (False, True): "Call to deprecated class method {name}." + suffix,
+            (False, False): "Call to deprecated method {name}." + suffix,
+        }
+        # Per-argument messages are just as constant as the reason/version, so
+        # they are interpolated once here; the call path only has to intersect
+        # the kwargs with the precomputed key set.
+        if deprecated_args is not None:
+            self._deprecated_arg_keys = frozenset(deprecated_args)
+            self._arg_templates = {}
+            for arg, spec in deprecated_args.items():
+                r = spec.get('reason')
+                v = spec.get('version')
+                rv = spec.get('remove_version')
+                parts = ["Call to deprecated Parameter {}.".format(arg)]
+                if r is not None:
+                    parts.append(" ({})".format(r))
+                if v is not None:
+                    parts.append("\n-- Deprecated since v{}.".format(v))
+                if rv is not None:
+                    parts.append("\n-- Will be removed in version {}.".format(rv))
+                self._arg_templates[arg] = "".join(parts)
+            # One or two deprecated arguments is the common case; a direct
+            # membership probe is cheaper than building a set intersection, so
+            # specialize the check once here.
+            args_tuple = tuple(self._deprecated_arg_keys)
+            if len(args_tuple) == 1:
+                arg0 = args_tuple[0]
+                self._check = lambda kwargs: (arg0,) if arg0 in kwargs else ()
+            elif len(args_tuple) == 2:
+                arg0, arg1 = args_tuple
+                self._check = lambda kwargs: tuple(a for a in (arg0, arg1) if a in kwargs)
+            else:
+                self._check = self._deprecated_arg_keys.intersection
+        else:
+            self._deprecated_arg_keys = frozenset()
+            self._arg_templates = {}
+            self._check = None
+        # Message lists keyed by the subset of deprecated arguments actually
+        # passed; with k deprecated arguments there are at most 2**k - 1
+        # subsets, so the cache is naturally bounded.
+        self._msg_cache = {}
+        # Resolve the action string to an emit callable once, so call sites
+        # dispatch directly instead of re-comparing the string on every call.
+        if action == "ignore":
+            self._emit = self._emit_ignore
+        elif action == "error":
+            self._emit = self._emit_error
+        elif action:
+            self._emit = self._emit_filtered
+        else:
+            self._emit = self._emit_default
+        # Name and class-ness of the wrapped object never change once decorated;
+        # they are filled in at decoration time so the wrapper does not have to
+        # re-run inspect.isclass on every call.
+        self._wrapped_name = None
+        self._wrapped_is_class = None
+        # Finished messages, keyed by the same (instance is None, is-class)
+        # pair: once a message has been built for a given call shape it is
+        # reused as-is on every subsequent call.
+        self._final_msgs = {}
         super(ClassicAdapter, self).__init__()
 
+    def _emit_ignore(self, message, stacklevel):
+        pass
+
+    def _emit_error(self, message, stacklevel):
+        # What simplefilter("error") would have raised, without the filter swap.
+        raise self.category(message)
+
+    def _emit_filtered(self, message, stacklevel):
+        with warnings.catch_warnings():
+            warnings.simplefilter(self.action, self.category)
+            warnings.warn(message, category=self.category, stacklevel=stacklevel + 1)
+
+    def _emit_default(self, message, stacklevel):
+        warnings.warn(message, category=self.category, stacklevel=stacklevel + 1)
+
     def get_deprecated_msg(self, wrapped, instance, kwargs):
         """
         Get the deprecation warning message for the user.
@@ -90,62 +228,38 @@ class ClassicAdapter(wrapt.AdapterFactory):
 
         Returns
         -------
-        The warning message.
+        The warning message as a string, a list of per-argument messages when
+        ``deprecated_args`` is used, or ``None`` when there is nothing to warn about.
         """
-        if instance is None:
-            if inspect.isclass(wrapped):
-                fmt = "Call to deprecated class {name}."
-            else:
-                fmt = "Call to deprecated function (or staticmethod) {name}."
-        else:
-            if inspect.isclass(instance):
-                fmt = "Call to deprecated class method {name}."
-            else:
-                fmt = "Call to deprecated method {name}."
-
-
         if self.deprecated_args is None:
-            name = wrapped.__name__
-            if self.reason != "":
-                fmt += " ({reason})"
-            if self.version != "":
-                fmt += "\n-- Deprecated since version {version}."
-            
-            if self.remove_version != "":
-                fmt += "\n-- Will be removed in version {remove_version}."
-
-            return {f'{name}': fmt.format(name=name, reason=self.reason, version=self.version, remove_version=self.remove_version)}
-
-
-        if self.deprecated_args is not None:                
-            self.argstodeprecate = set(self.deprecated_args.keys()).intersection(kwargs)
-            if len(self.argstodeprecate)!=0:
-                warningargs={}
-                #store deprecation message for each argument
-                for arg in self.argstodeprecate:
-                    name = arg
-                    fmt = "Call to deprecated Parameter {name}."
-                    r=''
-                    v=''
-                    rv=''
-                    if self.deprecated_args[arg].get('reason') is not None:
-                        r = self.deprecated_args[arg]['reason']
-                        fmt += " ({reason})"
-                    if self.deprecated_args[arg].get('version') is not None:
-                        v = self.deprecated_args[arg]['version']
-                        fmt += "\n-- Deprecated since v{version}."
-                    if self.deprecated_args[arg].get('remove_version') is not None:
-                        rv = self.deprecated_args[arg]['remove_version']
-                        fmt += "\n-- Will be removed in version {remove_version}."
-
-                    warningargs[arg] = fmt.format(name=name, reason=r, version=v, remove_version=rv)
+            if instance is None:
+                is_class = self._wrapped_is_class
+                if is_class is None:
+                    is_class = inspect.isclass(wrapped)
+                key = (True, is_class)
             else:
-                name=""
-
-        if name=="":
+                # isinstance against ``type`` is a C-level check, unlike
+                # inspect.isclass which adds a Python-level call.
+                key = (False, isinstance(instance, type))
+            name = self._wrapped_name
+            if name is None:
+                name = wrapped.__name__
+            msg = self._final_msgs.get(key)
+            if msg is None:
+                msg = self._templates[key].replace("{name}", name)
+                self._final_msgs[key] = msg
+            return msg
+
+
+        hits = self._check(kwargs)
+        if not hits:
             return None
-        else:
-            return warningargs
+        key = frozenset(hits)
+        msgs = self._msg_cache.get(key)
+        if msgs is None:
+            msgs = [self._arg_templates[arg] for arg in hits]
+            self._msg_cache[key] = msgs
+        return msgs
         
         
 
@@ -166,31 +280,104 @@ class ClassicAdapter(wrapt.AdapterFactory):
 
         """
         if inspect.isclass(wrapped):
+            self._wrapped_name = wrapped.__name__
+            self._wrapped_is_class = True
+            if self.action == "ignore":
+                # Every emission would be discarded; leave __new__ untouched so
+                # instantiation pays no wrapper cost at all.
+                return wrapped
             old_new1 = wrapped.__new__
+            emit = self._emit
+
+            # Whether old_new1 is object.__new__ is decided here, once, and a
+            # closure specialized for the answer is installed; instantiation no
+            # longer re-runs the identity check.
+            default_new = old_new1 is object.__new__
+
+            if self.deprecated_args is None:
+                # The instantiation message never changes; build it once here
+                # so __new__ only has to emit it.
+                class_msg = self.get_deprecated_msg(wrapped=wrapped, instance=None, kwargs=None)
+
+                if default_new:
 
-            def wrapped_cls(cls, *args, **kwargs):
-                msg = self.get_deprecated_msg(wrapped=wrapped, instance=None, kwargs=kwargs)
-                
-                for key in msg.keys():
-                    message = msg[key]
+                    def wrapped_cls(cls, *args, **kwargs):
+                        emit(class_msg, _class_stacklevel)
+                        return old_new1(cls)
+                else:
+
+                    def wrapped_cls(cls, *args, **kwargs):
+                        emit(class_msg, _class_stacklevel)
+                        # actually, we don't know the real signature of *old_new1*
+                        return old_new1(cls, *args, **kwargs)
+            else:
+
+                def warn_deprecated_args(kwargs):
                     #create a warning for every deprecated argument
-                    if self.action:
-                        with warnings.catch_warnings():
-                            warnings.simplefilter(self.action, self.category)
-                            warnings.warn(message, category=self.category, stacklevel=_class_stacklevel)
-                    else:
-                        warnings.warn(message, category=self.category, stacklevel=_class_stacklevel)
-    
-                if old_new1 is object.__new__:
-                    return old_new1(cls)
-                # actually, we don't know the real signature of *old_new1*
-                return old_new1(cls, *args, **kwargs)
+                    msgs = self.get_deprecated_msg(wrapped=wrapped, instance=None, kwargs=kwargs)
+                    if msgs:
+                        for message in msgs:
+                            # this helper adds one frame between __new__ and emit
+                            emit(message, _class_stacklevel + 1)
+
+                if default_new:
+
+                    def wrapped_cls(cls, *args, **kwargs):
+                        warn_deprecated_args(kwargs)
+                        return old_new1(cls)
+                else:
+
+                    def wrapped_cls(cls, *args, **kwargs):
+                        warn_deprecated_args(kwargs)
+                        # actually, we don't know the real signature of *old_new1*
+                        return old_new1(cls, *args, **kwargs)
 
             wrapped.__new__ = staticmethod(wrapped_cls)
 
         return wrapped
 
 
+# get_deprecated_msg implementations whose messages are fully determined at
+# decoration time, and can therefore be inlined as constants in a specialized
+# wrapper. Adapter subclasses with their own implementation are not registered,
+# since their messages may depend on the actual call.
+_specializable_msg_impls = {ClassicAdapter.get_deprecated_msg}
+
+
+def _specialize_wrapper(adapter, wrapped, category):
+    """
+    Compile a straight-line wrapper for *wrapped* with the finished deprecation
+    messages inlined as string constants, so a call executes no message lookup
+    at all. Only used for adapters registered in ``_specializable_msg_impls``.
+    """
+    namespace = {
+        '_wrapped': wrapped,
+        '_category': category,
+        '_warn': warnings.warn,
+        '_globally_ignored': _IgnoreCache(category),
+    }
+    lines = ["def wrapper(*args, **kwargs):"]
+    if adapter._deprecated_arg_keys:
+        arg_names = sorted(adapter._deprecated_arg_keys)
+        probes = " or ".join("{!r} in kwargs".format(arg) for arg in arg_names)
+        lines.append("    if ({}) and not _globally_ignored():".format(probes))
+        for arg in arg_names:
+            message = adapter.get_deprecated_msg(wrapped, None, {arg: None})[0]
+            lines.append("        if {!r} in kwargs:".format(arg))
+            lines.append("            _warn({!r}, category=_category, stacklevel=2)".format(message))
+    else:
+        message = adapter.get_deprecated_msg(wrapped, None, {})
+        if message is None:
+            # deprecated_args={}: nothing can ever be warned about, so the
+            # callable needs no wrapper at all.
+            return wrapped
+        lines.append("    if not _globally_ignored():")
+        lines.append("        _warn({!r}, category=_category, stacklevel=2)".format(message))
+    lines.append("    return _wrapped(*args, **kwargs)")
+    exec(compile("\n".join(lines), "<deprecat generated wrapper>", "exec"), namespace)
+    return functools.wraps(wrapped)(namespace['wrapper'])
+
+
 def deprecat(*args, **kwargs):
     """
     This is a decorator which can be used to mark functions
@@ -212,23 +399,74 @@ def deprecat(*args, **kwargs):
 
         wrapped = args[0]
         if inspect.isclass(wrapped):
+            adapter._wrapped_name = wrapped.__name__
+            adapter._wrapped_is_class = True
             wrapped = adapter(wrapped)
             return wrapped
 
         elif inspect.isroutine(wrapped):
+            # Filled in only after the type dispatch: probing __name__ on an
+            # arbitrary callable would shadow the TypeError raised below for
+            # unsupported types (e.g. a functools.partial).
+            adapter._wrapped_name = wrapped.__name__
+            adapter._wrapped_is_class = False
+            if action == "ignore":
+                # Every warning would be unconditionally discarded anyway;
+                # applying the adapter keeps the docstring side effects but
+                # avoids paying for a wrapper and a filter swap on every call.
+                return adapter(wrapped)
+
+            arg_keys = adapter._deprecated_arg_keys
+            # Bind the emit callable once at decoration time; the per-call cost
+            # is then a fast closure-cell load instead of two attribute lookups.
+            emit = adapter._emit
+            # With no explicit action the warning goes through the global
+            # filters; if those are set to unconditionally ignore the category
+            # there is no point in building and emitting the message at all.
+            globally_ignored = _IgnoreCache(category) if not action else None
+
+            # A function defined outside any class body can never be called as
+            # a bound method, so the wrapt proxy machinery (which exists to
+            # detect the bound instance) is pure overhead for it. Wrap it with
+            # a plain closure instead; functions defined in a class body keep
+            # the wrapt path so methods are still classified correctly.
+            qualname_parts = getattr(wrapped, '__qualname__', wrapped.__name__).split('.')
+            if len(qualname_parts) < 2 or qualname_parts[-2] == '<locals>':
+                # The adapter is still applied for its side effects (e.g. the
+                # Sphinx docstring directive).
+                wrapped = adapter(wrapped)
+
+                if action is None and type(adapter).get_deprecated_msg in _specializable_msg_impls:
+                    return _specialize_wrapper(adapter, wrapped, category)
+
+                @functools.wraps(wrapped)
+                def wrapper(*args_, **kwargs_):
+                    if arg_keys and arg_keys.isdisjoint(kwargs_):
+                        return wrapped(*args_, **kwargs_)
+                    if globally_ignored is not None and globally_ignored():
+                        return wrapped(*args_, **kwargs_)
+                    msg = adapter.get_deprecated_msg(wrapped, None, kwargs_)
+                    if msg:
+                        for message in ((msg,) if isinstance(msg, str) else msg):
+                            # The closure adds exactly one frame, so the caller
+                            # is always two frames up from the emit call.
+                            emit(message, 2)
+                    return wrapped(*args_, **kwargs_)
+
+                return wrapper
 
             @wrapt.decorator(adapter=adapter)
             def wrapper_function(wrapped_, instance_, args_, kwargs_):
+                if arg_keys and arg_keys.isdisjoint(kwargs_):
+                    # None of the deprecated arguments were passed: nothing to
+                    # warn about, skip the message machinery entirely.
+                    return wrapped_(*args_, **kwargs_)
+                if globally_ignored is not None and globally_ignored():
+                    return wrapped_(*args_, **kwargs_)
                 msg = adapter.get_deprecated_msg(wrapped_, instance_, kwargs_)
                 if msg:
-                    for key in msg.keys():
-                        message = msg[key]
-                        if action:
-                            with warnings.catch_warnings():
-                                warnings.simplefilter(action, category)
-                                warnings.warn(message, category=category, stacklevel=_routine_stacklevel)
-                        else:
-                            warnings.warn(message, category=category, stacklevel=_routine_stacklevel)
+                    for message in ((msg,) if isinstance(msg, str) else msg):
+                        emit(message, _routine_stacklevel)
                 return wrapped_(*args_, **kwargs_)
 
             return wrapper_function(wrapped)
@@ -4,12 +4,6 @@ Examples
 
 This module contains examples for the deprecat package.
 """
-import re
-import textwrap
-import functools
-import wrapt
-import warnings
-
 from deprecat.sphinx import deprecat
 
 @deprecat(reason="useless", version = "2.0")
@@ -20,8 +14,6 @@ class test_deprecat_on_class:
     def __init__(self):
         pass
 
-test_deprecat_on_class()
-
 class test_deprecat_on_class_method:
     def __init__(self):
         pass
@@ -36,9 +28,6 @@ class test_deprecat_on_class_method:
         """
         return a + b
 
-x = test_deprecat_on_class_method()
-x.randomfunction(1,2)
-
 @deprecat(reason="useless", version = "2.0")
 def test_deprecat_on_function(a, b):
     """
@@ -46,8 +35,6 @@ def test_deprecat_on_function(a, b):
     """
     return a + b
 
-test_deprecat_on_function(1,2)
-
 @deprecat(deprecated_args={'a':{'version':'4.0','reason':'nothing', 'remove_version': '5.0'}})
 def test_deprecated_args(a, b, c=3, d=4):
     """
@@ -69,4 +56,10 @@ def test_deprecated_args(a, b, c=3, d=4):
     """
     return a + b + c + d
 
-test_deprecated_args(a=2, b=3, c=4, d=5)
+
+if __name__ == "__main__":
+    test_deprecat_on_class()
+    x = test_deprecat_on_class_method()
+    x.randomfunction(1, 2)
+    test_deprecat_on_function(1, 2)
+    test_deprecated_args(a=2, b=3, c=4, d=5)
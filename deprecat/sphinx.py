@@ -14,12 +14,13 @@ of `Paragraph-level markups <http://www.sphinx-doc.org/en/stable/markup/para.htm
 
 """
 import re
+import sys
 import textwrap
 import functools
-import wrapt
 import warnings
 
 from deprecat.classic import ClassicAdapter
+from deprecat.classic import _specializable_msg_impls
 from deprecat.classic import deprecat as _classic_deprecat
 
 try:
@@ -32,11 +33,124 @@ try:
     _class_stacklevel = 2
 except ImportError:
     _routine_stacklevel = 3
-    if platform.python_implementation() == "PyPy":
+    if sys.implementation.name == "pypy":
         _class_stacklevel = 2
     else:
         _class_stacklevel = 3
-        
+
+# Sphinx cross references: ":role:`foo`" or ":domain:role:`foo`"
+_XREF_RE = re.compile(r":(?:[a-zA-Z]+:){1,2}(`[^`]*`)")
+
+def _locate_arg_insertion(docstring, arg):
+    """
+    Find where the deprecation admonition for ``arg`` belongs in a numpydoc
+    docstring, in a single pass over its lines instead of a cascade of regex
+    searches over overlapping slices.
+
+    The scan walks the lines once, looking in turn for the ``Parameters``
+    header, its dashed underline (whose leading whitespace fixes the section
+    indent), the entry for ``arg`` and finally the next entry or section.
+
+    Returns
+    -------
+    ``(cut, indent)`` where ``cut`` is the offset at which the admonition is
+    spliced into ``docstring``. ``indent`` is ``None`` when no Parameters
+    section exists; ``cut`` is ``None`` when ``arg`` has no entry in it.
+    """
+    SEEK_PARAMS, SEEK_DASHES, SEEK_ARG, SEEK_NEXT = range(4)
+    state = SEEK_PARAMS
+    offset = 0
+    indent = None
+    for line in docstring.splitlines(keepends=True):
+        stripped = line.strip()
+        if state == SEEK_PARAMS:
+            if stripped.endswith("Parameters"):
+                state = SEEK_DASHES
+        elif state == SEEK_DASHES:
+            if stripped.startswith("----------"):
+                indent = line[: len(line) - len(line.lstrip())]
+                state = SEEK_ARG
+            elif stripped:
+                state = SEEK_PARAMS
+        elif state == SEEK_ARG:
+            if line.startswith(indent):
+                rest = line[len(indent):]
+                if rest.startswith("-----"):
+                    # underline of the following section: arg is not documented here
+                    break
+                if rest.startswith(arg) and rest[len(arg):].lstrip().startswith(":"):
+                    state = SEEK_NEXT
+        else:  # SEEK_NEXT
+            if line.startswith(indent) and line[len(indent): len(indent) + 1].strip():
+                # start of the next entry (or section title): insert just
+                # before the newline that precedes this line
+                return offset - 1, indent
+        offset += len(line)
+    if state == SEEK_NEXT:
+        # arg is the last entry: insert at the very end
+        return len(docstring), indent
+    return None, indent
+
+
+@functools.lru_cache(maxsize=32)
+def _get_wrapper(width, initial, subsequent):
+    """
+    Return a shared TextWrapper for the given width/indent configuration.
+
+    Most decorations in a project reuse the default line length, so the
+    wrapper setup (which includes compiling the word-separation regex) is
+    paid once per configuration instead of once per paragraph. Hyphen and
+    long-word splitting are disabled: that selects the simpler separation
+    regex, and version numbers or identifiers in deprecation text should
+    not be broken mid-word anyway.
+    """
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=initial,
+        subsequent_indent=subsequent,
+        break_on_hyphens=False,
+        break_long_words=False,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_docstring(orig_doc, header, reason, line_length):
+    """
+    Build the docstring with the Sphinx directive block appended. The result is
+    fully determined by the arguments, so it is memoized: functions sharing the
+    same docstring and decorator configuration (common in generated code) pay
+    for the dedent/wrap/format work only once.
+    """
+    docstring = orig_doc or ""
+    # Only pay for dedent when some line actually carries leading whitespace;
+    # two C-level substring checks beat the regex scans inside textwrap.dedent.
+    if docstring[:1] in (" ", "\t") or "\n " in docstring or "\n\t" in docstring:
+        docstring = textwrap.dedent(docstring)
+    if docstring:
+    # An empty line must separate the original docstring and the directive.
+        parts = [docstring.rstrip("\n"), "\n\n"]
+    else:
+    # Avoid "Explicit markup ends without a blank line" when the decorated function has no docstring
+        parts = ["\n"]
+
+    width = line_length - 3 if line_length > 3 else 2 ** 16
+
+    parts.append(header + "\n")
+
+    #formatting for docstring
+    # An empty reason (common for versionadded/versionchanged) adds nothing:
+    # the directive line stands alone. The wrapped lines flow straight into
+    # `parts` -- no intermediate list.
+    if reason:
+        wrapper = _get_wrapper(width, "   ", "   ")
+        for paragraph in reason.splitlines():
+            if paragraph:
+                parts.extend(f"{line}\n" for line in wrapper.wrap(paragraph))
+            else:
+                parts.append("\n")
+    return "".join(parts)
+
+
 class SphinxAdapter(ClassicAdapter):
 
     """
@@ -110,6 +224,22 @@ class SphinxAdapter(ClassicAdapter):
         self.directive = directive
         self.line_length = line_length
         super(SphinxAdapter, self).__init__(reason=reason, version=version, remove_version=remove_version, action=action, category=category, deprecated_args=deprecated_args)
+        # Version markers only touch the docstring; no warning machinery.
+        self._is_version_marker = directive in ("versionadded", "versionchanged")
+        # The directive header only depends on adapter state: build it once.
+        self._header_line = f".. {directive}:: {version}" if version else f".. {directive}::"
+        # Same for the reason text: append the removal warning and
+        # dedent/strip once here instead of on every decoration.
+        reason_text = self.reason
+        if remove_version != "":
+            reason_text += f'\n\nWarning: This deprecated feature will be removed in version {remove_version}'
+        self._reason_stripped = textwrap.dedent(reason_text).strip() if reason_text else ""
+        # Select the docstring builder once: each path stays a small,
+        # monomorphic method instead of branching on every decoration.
+        if deprecated_args is None:
+            self._build_doc = self._build_simple
+        else:
+            self._build_doc = self._build_with_deprecated_args
 
     def __call__(self, wrapped):
         """
@@ -125,118 +255,73 @@ class SphinxAdapter(ClassicAdapter):
         -------
         the decorated class or function.
         """
-        docstring = textwrap.dedent(wrapped.__doc__ or "")
+        wrapped.__doc__ = self._build_doc(wrapped)
+        if self._is_version_marker:
+             return wrapped
+
+        return super(SphinxAdapter, self).__call__(wrapped)
+
+    def _build_simple(self, wrapped):
+        """
+        Append the directive block to the docstring (no deprecated args).
+        """
+        return _build_docstring(
+            wrapped.__doc__, self._header_line, self._reason_stripped, self.line_length
+        )
+
+    def _build_with_deprecated_args(self, wrapped):
+        """
+        Insert a warning admonition under each deprecated argument's entry
+        in a numpydoc-style Parameters section.
+        """
+        docstring = wrapped.__doc__ or ""
+        if docstring[:1] in (" ", "\t") or "\n " in docstring or "\n\t" in docstring:
+            docstring = textwrap.dedent(docstring)
         if docstring:
         # An empty line must separate the original docstring and the directive.
-            docstring = re.sub(r"\n+$", "", docstring, flags=re.DOTALL) + "\n\n"
+            docstring = docstring.rstrip("\n") + "\n\n"
         else:
         # Avoid "Explicit markup ends without a blank line" when the decorated function has no docstring
             docstring = "\n"
 
-        width = self.line_length - 3 if self.line_length > 3 else 2 ** 16
-        reason = self.reason
-        if self.remove_version!="":
-            reason += f'\n\nWarning: This deprecated feature will be removed in version {self.remove_version}'
-        reason = textwrap.dedent(reason).strip()
-
-        if self.deprecated_args is None:
-            fmt = ".. {directive}:: {version}" if self.version else ".. {directive}::"
-            div_lines = [fmt.format(directive=self.directive, version=self.version)]
-            
-            #formatting for docstring
-            for paragraph in reason.splitlines():
-                if paragraph:
-                    div_lines.extend(
-                        textwrap.fill(
-                            paragraph,
-                            width=width,
-                            initial_indent="   ",
-                            subsequent_indent="   ",
-                        ).splitlines()
-                    )
-                else:
-                    div_lines.append("")
-            # -- append the directive division to the docstring
-            docstring += "".join("{}\n".format(line) for line in div_lines)
-
+        if docstring=="\n":
+            warnings.warn("Missing docstring, consider adding a numpydoc style docstring for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
         else:
-            if docstring=="\n":
-                warnings.warn("Missing docstring, consider adding a numpydoc style docstring for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
-            else:
-                for arg in set(self.deprecated_args.keys()):
-                    #first we search for the location of the parameters section
-                    search = re.search("Parameters[\\s]*\n[\\s]*----------", docstring)
-                    if search is None:
-                        warnings.warn("Missing Parameter section, consider adding a numpydoc style parameters section in your docstring for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
+            for arg in self.deprecated_args:
+                #one linear scan locates the parameters section, the arg and the insertion point
+                cut, indent = _locate_arg_insertion(docstring, arg)
+                if indent is None:
+                    warnings.warn("Missing Parameter section, consider adding a numpydoc style parameters section in your docstring for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
+                elif cut is None:
+                    warnings.warn(f"Missing description for parameter {arg}, consider adding a numpydoc style description for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
+                else:
+                    #we build the warning admonition header
+                    arg_spec = self.deprecated_args[arg]
+                    version = arg_spec.get('version')
+                    remove_version = arg_spec.get('remove_version')
+                    if version is not None:
+                        #the spaces are specifically cherrypicked for numpydoc docstrings
+                        header = f"    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter {arg} deprecated since {version}"
+                        if remove_version is not None:
+                            header += f" and will be removed in version {remove_version}."
                     else:
-                        params_string = docstring[search.start():search.end()]
-
-                        #we store the indentation of the values 
-                        indentsize = re.search("----------", params_string).start() - re.search("Parameters[\\s]*\n", params_string).end()
-                        indent = ' '*indentsize
-
-                        # we check if there is another section after parameters
-                        if re.search(f"\n{indent}-----", docstring[search.end():]) is not None:
-                            #if yes then we find the range of the parameters section
-                            params_section_end = search.end() + re.search(f"\n{indent}-----", docstring[search.end():]).start()
-                            dashes_in_next_section = docstring[params_section_end:].count('-')
-                            params_section_end = params_section_end - dashes_in_next_section
-                            params_section = docstring[search.start():params_section_end]
-                        else:
-                            #else the entire remaining docstring is in the parameters section
-                            params_section = docstring[search.start():]
-
-                        #we search for the description of the particular parameter we care about
-                        if re.search(f"\n{indent}{arg}\\s*:", params_section) is not None:
-                            description_start = re.search(f"\n{indent}{arg}\\s*:", params_section).end()
-                            #we check whether there are more parameters after this one, or if its the last parameter described in the secion
-                            #and store the position where we insert the warning
-
-                            if re.search(f"\n{indent}\\S", params_section[description_start:]):
-                                insert_pos = re.search(f"\n{indent}\\S", params_section[description_start:]).start()
-                            else:
-                                insert_pos = len(params_section[description_start:])
-                            
-                            #finally we store the warning fmt string
-                            if self.deprecated_args[arg].get('version') is not None:
-                                #the spaces are specifically cherrypicked for numpydoc docstrings
-                                fmt = "\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter {arg} deprecated since {version}"
-                                if self.deprecated_args[arg].get('remove_version') is not None:
-                                    fmt += " and will be removed in version {remove_version}."
-                                    div_lines = [fmt.format(version=self.deprecated_args[arg]['version'],arg=arg, remove_version=self.deprecated_args[arg]['remove_version'])]
-                                else:
-                                    div_lines = [fmt.format(version=self.deprecated_args[arg]['version'],arg=arg)]
-                            else:
-                                fmt = "\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter {arg} deprecated"
-                                div_lines = [fmt.format(version=self.deprecated_args[arg]['version'],arg=arg)]
-                            width = 2**16
-                            if self.remove_version!="":
-                                self.reason += f'\n\nWarning: This deprecated feature will be removed in version {self.remove_version}'
-                            reason = textwrap.dedent(self.reason).strip()
-                            #formatting for docstring
-                            for paragraph in reason.splitlines():
-                                div_lines.extend(
-                                    textwrap.fill(
-                                        paragraph,
-                                        width=width,
-                                        initial_indent=indent,
-                                        subsequent_indent=indent,
-                                    ).splitlines()
-                                )
-                            # -- append the directive division to the docstring
-                            a=''
-                            a += "".join("{}\n".format(line) for line in div_lines)
-                            a = textwrap.indent(a, indent)
-                            docstring = docstring[:search.start() + description_start+insert_pos]+"\n\n"+a+"\n\n"+docstring[search.start() + description_start+insert_pos:]
-                            docstring = re.sub(r"[\n]{3,}", "\n\n", docstring)
-                        else:
-                            warnings.warn(f"Missing description for parameter {arg}, consider adding a numpydoc style description for the decorator to work (Sphinx directive won't be added)" , category=UserWarning, stacklevel=_class_stacklevel)
-
-        wrapped.__doc__ = docstring
-        if self.directive in {"versionadded", "versionchanged"}:
-             return wrapped
+                        header = f"    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter {arg} deprecated"
+                    div_lines = [header]
+                    #formatting for docstring (skipped entirely when there is no reason text)
+                    if self._reason_stripped:
+                        wrapper = _get_wrapper(2 ** 16, indent, indent)
+                        for paragraph in self._reason_stripped.splitlines():
+                            div_lines.extend(wrapper.wrap(paragraph))
+                    # -- splice the admonition block into the docstring with
+                    # exactly one blank line on each side; normalizing the
+                    # junctions here beats re-scanning the whole docstring
+                    # for accidental newline runs afterwards
+                    a = textwrap.indent("\n".join(div_lines), indent)
+                    docstring = "".join(
+                        (docstring[:cut].rstrip("\n"), "\n\n", a, "\n\n", docstring[cut:].lstrip("\n"))
+                    )
 
-        return super(SphinxAdapter, self).__call__(wrapped)
+        return docstring
 
     def get_deprecated_msg(self, wrapped, instance, kwargs):
         """
@@ -262,14 +347,36 @@ class SphinxAdapter(ClassicAdapter):
         # Strip Sphinx cross reference syntax (like ":function:", ":py:func:" and ":py:meth:")
         # Possible values are ":role:`foo`", ":domain:role:`foo`"
         # where ``role`` and ``domain`` should match "[a-zA-Z]+"
-        
-        #remember the msg variable is a dict
+        # A cross reference needs backticks, so most messages can skip the
+        # regex after a C-level containment check.
         if msg:
-            for key, value in msg.items():
-                msg[key] = re.sub(r"(?: : [a-zA-Z]+ )? : [a-zA-Z]+ : (`[^`]*`)", r"\1", value, flags=re.X)
-                
+            if isinstance(msg, str):
+                if "`" in msg:
+                    msg = _XREF_RE.sub(r"\1", msg)
+            else:
+                msg = [_XREF_RE.sub(r"\1", value) if "`" in value else value for value in msg]
+
         return msg
 
+# SphinxAdapter messages only depend on decoration-time state (the stripping is
+# deterministic), so the classic module may inline them in compiled wrappers.
+_specializable_msg_impls.add(SphinxAdapter.get_deprecated_msg)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_version_marker_adapter(directive, reason, version, line_length):
+    """
+    Memoized SphinxAdapter construction for versionadded/versionchanged.
+
+    A library typically decorates many symbols with the same argument tuple
+    (e.g. ``@versionadded(version="1.2")``); the version-marker adapters only
+    edit docstrings and carry no per-decoration state, so one instance can
+    safely serve every call site. The ``deprecat`` pipeline bypasses this
+    cache: its adapters are bound to the wrapped object.
+    """
+    return SphinxAdapter(directive, reason=reason, version=version, line_length=line_length)
+
+
 #this should only be used for functions, methods or classes. NOT parameters.
 def versionadded(reason="", version="", line_length=70):
     """
@@ -294,13 +401,7 @@ def versionadded(reason="", version="", line_length=70):
     Decorator used to modify docstring.
 
     """
-    adapter = SphinxAdapter(
-        'versionadded',
-        reason=reason,
-        version=version,
-        line_length=line_length,
-    )
-    return adapter
+    return _get_version_marker_adapter('versionadded', reason, version, line_length)
 
 
 #this should only be used for functions, methods or classes. NOT parameters.
@@ -325,13 +426,7 @@ def versionchanged(reason="", version="", line_length=70):
     -------
     Decorator used to modify docstring.
     """
-    adapter = SphinxAdapter(
-        'versionchanged',
-        reason=reason,
-        version=version,
-        line_length=line_length,
-     )
-    return adapter
+    return _get_version_marker_adapter('versionchanged', reason, version, line_length)
 
 
 def deprecat(reason="", directive="deprecated", version="", remove_version="", line_length=70, deprecated_args=None, **kwargs):
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import functools
 import sys
 import warnings
 
@@ -199,6 +200,29 @@ def test_should_raise_type_error():
         pass
 
 
+def test_empty_deprecated_args_does_not_warn():
+    # An empty dict means "no deprecated arguments", not "deprecate the
+    # whole function": calls stay silent.
+    @deprecat.classic.deprecat(version="1.2.3", deprecated_args={})
+    def foo(a, b):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo(a=1, b=2)
+    assert len(warns) == 0
+
+
+def test_should_raise_type_error_for_unsupported_callable():
+    # A callable that is neither a class nor a routine (e.g. a partial)
+    # must hit the TypeError path, not an AttributeError on __name__.
+    try:
+        deprecat.classic.deprecat(version="1.2.3")(functools.partial(print))
+        assert False, "TypeError not raised"
+    except TypeError:
+        pass
+
+
 def test_warning_msg_has_reason():
     reason = "Good reason"
 
@@ -1,6 +1,5 @@
 # coding: utf-8
-from __future__ import print_function
-
+import functools
 import re
 import sys
 import textwrap
@@ -10,6 +9,105 @@ import pytest
 
 import deprecat.sphinx
 
+# Evaluated once: the interpreter version does not change mid-run.
+_PY39 = sys.version_info >= (3, 9)
+
+
+@functools.lru_cache(maxsize=None)
+def _sphinx_adapter(directive, reason, version):
+    # One adapter per (directive, reason, version) across all parametrized
+    # rows instead of a fresh construction per row.
+    return deprecat.sphinx.SphinxAdapter(directive, reason=reason, version=version)
+
+
+# Expected directive blocks, built once at import instead of dedented anew
+# inside every parametrize decorator (the first template was a single-line
+# string, making its dedent a no-op anyway).
+_EXPECTED_FN_FULL = (
+    ".. {directive}:: {version}\n   {reason}\n\n   Warning: This deprecated feature will be removed in version\n   {remove_version}\n"
+)
+_EXPECTED_CLS_FULL = textwrap.dedent(
+    """\
+    .. {directive}:: {version}
+       {reason}
+
+       Warning: This deprecated feature will be removed in version {remove_version}
+    """
+)
+_EXPECTED_VERSION_ONLY = ".. {directive}:: {version}\n"
+
+# A blank (possibly space-padded) line separating the original docstring from
+# the directive. No DOTALL needed: the pattern contains no dot.
+_TRAILING_BLANK_RE = re.compile(r"\n[ ]*\n$")
+
+# Byte-exact docstrings expected after deprecated_args admonition insertion.
+_EXPECTED_FN_ARG_DOCSTRING = "\nParameters\n----------\nx : int \n    [description]\na : int\n    [description]\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter a deprecated since 4.0 and will be removed in version 5.0.\n\nb : int\n    [description]\n\n"
+_EXPECTED_CLS_METHOD_ARG_DOCSTRING = "\nParameters\n----------\nx : int \n    [description]\na : int\n    [description]\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter a deprecated since 4.0\n\nb : int\n    [description]\n\n"
+
+# (factory attribute, sphinx directive name)
+_DIRECTIVES = [
+    ('versionadded', 'versionadded'),
+    ('versionchanged', 'versionchanged'),
+    ('deprecat', 'deprecated'),
+]
+
+# (id, reason, version, remove_version, expected)
+_FN_DOCSTRING_ROWS = [
+    ("reason&version", 'A good reason', '1.2.0', '1.3.0', _EXPECTED_FN_FULL),
+    ("version", '', '1.2.0', "", _EXPECTED_VERSION_ONLY),
+]
+_CLS_DOCSTRING_ROWS = [
+    ("reason&version", 'A good reason', '1.2.0', '1.3.0', _EXPECTED_CLS_FULL),
+    ("version", "", '1.2.0', "", _EXPECTED_VERSION_ONLY),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _make_decorator(directive, reason, version, remove_version, line_length):
+    # The decorator is a pure function of its arguments (each application
+    # builds a fresh adapter), so one instance can serve every docstring
+    # param sharing a configuration.
+    factory = getattr(deprecat.sphinx, directive)
+    if directive in ("versionadded", "versionchanged"):
+        return factory(reason=reason, version=version, line_length=line_length)
+    return factory(reason=reason, version=version, remove_version=remove_version, line_length=line_length)
+
+
+@pytest.fixture(autouse=True)
+def _clear_warning_registries():
+    # The "once"/"default" filter actions key off per-module
+    # __warningregistry__ state; with session-scoped decorated objects a
+    # warning recorded in one test could silently suppress the same warning
+    # in a later one. Start every test with clean registries.
+    for mod_name in (__name__, "deprecat.sphinx", "deprecat.classic"):
+        mod = sys.modules.get(mod_name)
+        if mod is not None:
+            mod.__dict__.pop("__warningregistry__", None)
+
+
+def pytest_generate_tests(metafunc):
+    # Generate only the meaningful (directive, row) combinations for the two
+    # docstring tests: the version-marker factories take no remove_version,
+    # so those combinations used to be collected and then silently returned
+    # from inside the test body.
+    rows = {
+        "test_has_sphinx_docstring": _FN_DOCSTRING_ROWS,
+        "test_cls_has_sphinx_docstring": _CLS_DOCSTRING_ROWS,
+    }.get(metafunc.definition.name)
+    if rows is None:
+        return
+    params = []
+    ids = []
+    for directive, sphinx_directive in _DIRECTIVES:
+        for row_id, reason, version, remove_version, expected in rows:
+            if directive != 'deprecat' and remove_version:
+                continue
+            params.append((directive, sphinx_directive, reason, version, remove_version, expected))
+            ids.append(f"{directive}-{row_id}")
+    metafunc.parametrize(
+        "directive, sphinx_directive, reason, version, remove_version, expected", params, ids=ids
+    )
+
 
 @pytest.fixture(
     scope="module",
@@ -28,42 +126,8 @@ import deprecat.sphinx
 def docstring(request):
     return request.param
 
-@pytest.fixture(scope="module", params=['versionadded', 'versionchanged', 'deprecat'])
-def directive(request):
-    return request.param
-
-@pytest.fixture(scope="module")
-def sphinx_directive(directive):
-    mapping = {'versionadded':'versionadded','versionchanged':'versionchanged','deprecat':'deprecated'}
-    return mapping[directive]
-
-
 # noinspection PyShadowingNames
-@pytest.mark.parametrize(
-    "reason, version, remove_version, expected",
-    [
-        (
-            'A good reason',
-            '1.2.0',
-            '1.3.0',
-            textwrap.dedent(
-                ".. {directive}:: {version}\n   {reason}\n\n   Warning: This deprecated feature will be removed in version\n   {remove_version}\n"
-            ),
-        ),
-        (
-            '',
-            '1.2.0',
-            "",
-            textwrap.dedent(
-                """\
-                .. {directive}:: {version}
-                """
-            ),
-        ),
-    ],
-    ids=["reason&version", "version"],
-)
-def test_has_sphinx_docstring(docstring, directive, sphinx_directive, reason, version, remove_version, expected):
+def test_has_sphinx_docstring(recwarn, docstring, directive, sphinx_directive, reason, version, remove_version, expected):
     # The function:
     def foo(x, y):
         return x + y
@@ -72,15 +136,10 @@ def test_has_sphinx_docstring(docstring, directive, sphinx_directive, reason, ve
     foo.__doc__ = docstring
 
     # is decorated with:
-    decorator_factory = getattr(deprecat.sphinx, directive)
-    if directive in ("versionadded", "versionchanged") and remove_version is not None:
-        return
-
+    decorator = _make_decorator(directive, reason, version, remove_version, 70)
     if directive in ("versionadded", "versionchanged"):
-        decorator = decorator_factory(reason=reason, version=version)
         expected = expected.format(directive=sphinx_directive, version=version, reason=reason, remove_version=None)
     else:
-        decorator = decorator_factory(reason=reason, version=version, remove_version=remove_version)
         expected = expected.format(directive=sphinx_directive, version=version, reason=reason, remove_version=remove_version)
     foo = decorator(foo)
 
@@ -92,58 +151,23 @@ def test_has_sphinx_docstring(docstring, directive, sphinx_directive, reason, ve
     current = current.replace(expected, '')
     if docstring:
         # An empty line must separate the original docstring and the directive.
-        assert re.search("\n[ ]*\n$", current, flags=re.DOTALL)
+        assert _TRAILING_BLANK_RE.search(current)
     else:
         # Avoid "Explicit markup ends without a blank line" when the decorated function has no docstring
         assert current == "\n"
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo(1, 2)
+    foo(1, 2)
 
     if directive in {'versionadded', 'versionchanged'}:
         # don't emit DeprecationWarning
-        assert len(warns) == 0
+        assert len(recwarn) == 0
     else:
         # emit DeprecationWarning
-        assert len(warns) == 1
+        assert len(recwarn) == 1
 
 
 # noinspection PyShadowingNames
-@pytest.mark.skipif(
-    sys.version_info < (3, 3), reason="Classes should have mutable docstrings -- resolved in python 3.3"
-)
-@pytest.mark.parametrize(
-    "reason, version, remove_version, expected",
-    [
-        (
-            'A good reason',
-            '1.2.0',
-            '1.3.0',
-            textwrap.dedent(
-                """\
-                .. {directive}:: {version}
-                   {reason}
-
-                   Warning: This deprecated feature will be removed in version {remove_version}
-                """
-            ),
-        ),
-        (
-            "",
-            '1.2.0',
-            "",
-            textwrap.dedent(
-                """\
-                .. {directive}:: {version}
-                """
-            ),
-        ),
-    ],
-    ids=["reason&version", "version"],
-)
-def test_cls_has_sphinx_docstring(docstring, directive, sphinx_directive, reason, version, remove_version, expected):
-    if directive in ("versionadded", "versionchanged") and remove_version is not None:
-        return
+def test_cls_has_sphinx_docstring(recwarn, docstring, directive, sphinx_directive, reason, version, remove_version, expected):
     # The class:
     class Foo(object):
         pass
@@ -152,13 +176,10 @@ def test_cls_has_sphinx_docstring(docstring, directive, sphinx_directive, reason
     Foo.__doc__ = docstring
 
     # is decorated with:
-    decorator_factory = getattr(deprecat.sphinx, directive)
-
+    decorator = _make_decorator(directive, reason, version, remove_version, 85)
     if directive in ("versionadded", "versionchanged"):
-        decorator = decorator_factory(reason=reason, version=version, line_length=85)
         expected = expected.format(directive=sphinx_directive, version=version, reason=reason, remove_version=None, line_length=85)
     else:
-        decorator = decorator_factory(reason=reason, version=version, remove_version=remove_version, line_length=85)
         expected = expected.format(directive=sphinx_directive, version=version, reason=reason, remove_version=remove_version, line_length=85)
     Foo = decorator(Foo)
 
@@ -172,20 +193,19 @@ def test_cls_has_sphinx_docstring(docstring, directive, sphinx_directive, reason
     current = current.replace(expected, '')
     if docstring:
         # An empty line must separate the original docstring and the directive.
-        assert re.search("\n[ ]*\n$", current, flags=re.DOTALL)
+        assert _TRAILING_BLANK_RE.search(current)
     else:
         # Avoid "Explicit markup ends without a blank line" when the decorated function has no docstring
         assert current == "\n"
 
-    with warnings.catch_warnings(record=True) as warns:
-        Foo()
+    Foo()
 
     if directive in {'versionadded', 'versionchanged'}:
         # don't emit DeprecationWarning
-        assert len(warns) == 0
+        assert len(recwarn) == 0
     else:
         # emit DeprecationWarning
-        assert len(warns) == 1
+        assert len(recwarn) == 1
 
 
 class MyDeprecationWarning(DeprecationWarning):
@@ -200,7 +220,7 @@ _PARAMS = [
 ]
 
 
-@pytest.fixture(scope="module", params=_PARAMS)
+@pytest.fixture(scope="session", params=_PARAMS)
 def sphinx_deprecat_function(request):
     kwargs = request.param
 
@@ -211,7 +231,7 @@ def sphinx_deprecat_function(request):
     return foo1
 
 
-@pytest.fixture(scope="module", params=_PARAMS)
+@pytest.fixture(scope="session", params=_PARAMS)
 def sphinx_deprecat_class(request):
     kwargs = request.param
 
@@ -222,7 +242,7 @@ def sphinx_deprecat_class(request):
     return Foo2
 
 
-@pytest.fixture(scope="module", params=_PARAMS)
+@pytest.fixture(scope="session", params=_PARAMS)
 def sphinx_deprecat_method(request):
     kwargs = request.param
 
@@ -234,7 +254,7 @@ def sphinx_deprecat_method(request):
     return Foo3
 
 
-@pytest.fixture(scope="module", params=_PARAMS)
+@pytest.fixture(scope="session", params=_PARAMS)
 def sphinx_deprecat_static_method(request):
     kwargs = request.param
 
@@ -247,7 +267,7 @@ def sphinx_deprecat_static_method(request):
     return Foo4.foo4
 
 
-@pytest.fixture(scope="module", params=_PARAMS)
+@pytest.fixture(scope="session", params=_PARAMS)
 def sphinx_deprecat_class_method(request):
     kwargs = request.param
 
@@ -260,64 +280,66 @@ def sphinx_deprecat_class_method(request):
     return Foo5
 
 
+@pytest.fixture
+def record_warnings():
+    """
+    Run a callable with an "always" filter and return the recorded warnings.
+
+    One helper replaces the per-test catch_warnings/simplefilter dance in
+    the ``*__warns`` tests below.
+    """
+    def _record(func):
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            func()
+        return warns
+
+    return _record
+
+
 # noinspection PyShadowingNames
-def test_sphinx_deprecat_function__warns(sphinx_deprecat_function):
-    with warnings.catch_warnings(record=True) as warns:
-        warnings.simplefilter("always")
-        sphinx_deprecat_function()
+def test_sphinx_deprecat_function__warns(sphinx_deprecat_function, record_warnings):
+    warns = record_warnings(sphinx_deprecat_function)
     assert len(warns) == 1
     warn = warns[0]
-    assert issubclass(warn.category, DeprecationWarning)
+    assert warn.category in (DeprecationWarning, MyDeprecationWarning)
     assert "deprecated function (or staticmethod)" in str(warn.message)
 
 
 # noinspection PyShadowingNames
-@pytest.mark.skipif(
-    sys.version_info < (3, 3), reason="Classes should have mutable docstrings -- resolved in python 3.3"
-)
-def test_sphinx_deprecat_class__warns(sphinx_deprecat_class):
-    with warnings.catch_warnings(record=True) as warns:
-        warnings.simplefilter("always")
-        sphinx_deprecat_class()
+def test_sphinx_deprecat_class__warns(sphinx_deprecat_class, record_warnings):
+    warns = record_warnings(sphinx_deprecat_class)
     assert len(warns) == 1
     warn = warns[0]
-    assert issubclass(warn.category, DeprecationWarning)
+    assert warn.category in (DeprecationWarning, MyDeprecationWarning)
     assert "deprecated class" in str(warn.message)
 
 
 # noinspection PyShadowingNames
-def test_sphinx_deprecat_method__warns(sphinx_deprecat_method):
-    with warnings.catch_warnings(record=True) as warns:
-        warnings.simplefilter("always")
-        obj = sphinx_deprecat_method()
-        obj.foo3()
+def test_sphinx_deprecat_method__warns(sphinx_deprecat_method, record_warnings):
+    warns = record_warnings(lambda: sphinx_deprecat_method().foo3())
     assert len(warns) == 1
     warn = warns[0]
-    assert issubclass(warn.category, DeprecationWarning)
+    assert warn.category in (DeprecationWarning, MyDeprecationWarning)
     assert "deprecated method" in str(warn.message)
 
 
 # noinspection PyShadowingNames
-def test_sphinx_deprecat_static_method__warns(sphinx_deprecat_static_method):
-    with warnings.catch_warnings(record=True) as warns:
-        warnings.simplefilter("always")
-        sphinx_deprecat_static_method()
+def test_sphinx_deprecat_static_method__warns(sphinx_deprecat_static_method, record_warnings):
+    warns = record_warnings(sphinx_deprecat_static_method)
     assert len(warns) == 1
     warn = warns[0]
-    assert issubclass(warn.category, DeprecationWarning)
+    assert warn.category in (DeprecationWarning, MyDeprecationWarning)
     assert "deprecated function (or staticmethod)" in str(warn.message)
 
 
 # noinspection PyShadowingNames
-def test_sphinx_deprecat_class_method__warns(sphinx_deprecat_class_method):
-    with warnings.catch_warnings(record=True) as warns:
-        warnings.simplefilter("always")
-        cls = sphinx_deprecat_class_method()
-        cls.foo5()
+def test_sphinx_deprecat_class_method__warns(sphinx_deprecat_class_method, record_warnings):
+    warns = record_warnings(lambda: sphinx_deprecat_class_method().foo5())
     assert len(warns) == 1
     warn = warns[0]
-    assert issubclass(warn.category, DeprecationWarning)
-    if sys.version_info >= (3, 9):
+    assert warn.category in (DeprecationWarning, MyDeprecationWarning)
+    if _PY39:
         assert "deprecated class method" in str(warn.message)
     else:
         assert "deprecated function (or staticmethod)" in str(warn.message)
@@ -334,32 +356,30 @@ def test_should_raise_type_error():
         pass
 
 
-def test_warning_msg_has_reason():
+def test_warning_msg_has_reason(recwarn):
     reason = "Good reason"
 
     @deprecat.sphinx.deprecat(version="4.5.6", reason=reason)
     def foo():
         pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo()
-    warn = warns[0]
+    foo()
+    warn = recwarn.pop(DeprecationWarning)
     assert reason in str(warn.message)
 
 
-def test_warning_msg_has_version():
+def test_warning_msg_has_version(recwarn):
     version = "1.2.3"
 
     @deprecat.sphinx.deprecat(version=version)
     def foo():
         pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo()
-    warn = warns[0]
+    foo()
+    warn = recwarn.pop(DeprecationWarning)
     assert version in str(warn.message)
 
-def test_deprecated_arg_warn_class_method():
+def test_deprecated_arg_warn_class_method(recwarn):
 
     class Foo5(object):
         @classmethod
@@ -367,26 +387,27 @@ def test_deprecated_arg_warn_class_method():
         def foo5(cls, a, b):
             pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        Foo5.foo5(a=3, b=4)
-        
-    assert len(warns) == 1
-    warn = warns[0]
+    # Decoration itself warns about the missing docstring; only count the
+    # warnings emitted by the call.
+    recwarn.clear()
+    Foo5.foo5(a=3, b=4)
+
+    assert len(recwarn) == 1
+    warn = recwarn.pop(DeprecationWarning)
     assert 'Call to deprecated Parameter a. (nothing)\n-- Deprecated since v4.0.' in str(warn.message)
 
-def test_deprecated_arg_warn_class_init():
+def test_deprecated_arg_warn_class_init(recwarn):
 
     @deprecat.sphinx.deprecat(deprecated_args={'a':{'version':'4.0','reason':'nothing'}})
     class foo_cls:
         pass
-        
+
         def __init__(self,a,b):
             pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo_cls(a=3,b=4)
+    foo_cls(a=3,b=4)
 
-    warn = warns[0]
+    warn = recwarn.pop(DeprecationWarning)
     assert 'Call to deprecated Parameter a. (nothing)\n-- Deprecated since v4.0.' in str(warn.message)
 
 def test_deprecated_arg_warn_function_docstring():
@@ -404,8 +425,7 @@ def test_deprecated_arg_warn_function_docstring():
         """
         pass
 
-    expected_new_docstring = "\nParameters\n----------\nx : int \n    [description]\na : int\n    [description]\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter a deprecated since 4.0 and will be removed in version 5.0.\n\nb : int\n    [description]\n\n"
-    assert foo.__doc__ == expected_new_docstring
+    assert foo.__doc__ == _EXPECTED_FN_ARG_DOCSTRING
 
 def test_deprecated_arg_warn_class_method_docstring():
     
@@ -426,29 +446,43 @@ def test_deprecated_arg_warn_class_method_docstring():
             """
             pass
     
-    expected_new_docstring = "\nParameters\n----------\nx : int \n    [description]\na : int\n    [description]\n\n    .. admonition:: Deprecated\n      :class: warning\n\n      Parameter a deprecated since 4.0\n\nb : int\n    [description]\n\n"
+    assert Foo5.foo5.__doc__ == _EXPECTED_CLS_METHOD_ARG_DOCSTRING
 
-    assert Foo5.foo5.__doc__ == expected_new_docstring
+def test_empty_deprecated_args_is_noop(recwarn):
+    # An empty dict means "no deprecated arguments": no admonition, no
+    # ".. deprecated::" directive and no warning on call.
+    @deprecat.sphinx.deprecat(version="4.5.6", deprecated_args={})
+    def foo(a):
+        """
+        Parameters
+        ----------
+        a : int
+            [description]
+        """
+
+    assert ".. deprecated::" not in foo.__doc__
+    assert ".. admonition::" not in foo.__doc__
+    foo(a=1)
+    assert len(recwarn) == 0
 
-def test_warning_is_ignored():
+
+def test_warning_is_ignored(recwarn):
     @deprecat.sphinx.deprecat(version="4.5.6", action='ignore')
     def foo():
         pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo()
-    assert len(warns) == 0
+    foo()
+    assert len(recwarn) == 0
 
 
-def test_specific_warning_cls_is_used():
+def test_specific_warning_cls_is_used(recwarn):
     @deprecat.sphinx.deprecat(version="4.5.6", category=MyDeprecationWarning)
     def foo():
         pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo()
-    warn = warns[0]
-    assert issubclass(warn.category, MyDeprecationWarning)
+    foo()
+    warn = recwarn.pop(MyDeprecationWarning)
+    assert warn.category is MyDeprecationWarning
 
 
 def test_can_catch_warnings():
@@ -465,46 +499,47 @@ def test_can_catch_warnings():
         ("Use :py:func:`bar` instead", "Use `bar` instead"),
     ],
 )
-def test_sphinx_syntax_trimming(reason, expected):
+def test_sphinx_syntax_trimming(recwarn, reason, expected):
     @deprecat.sphinx.deprecat(version="4.5.6", reason=reason)
     def foo():
         pass
 
-    with warnings.catch_warnings(record=True) as warns:
-        foo()
-    warn = warns[0]
+    foo()
+    warn = recwarn.pop(DeprecationWarning)
     assert expected in str(warn.message)
 
 
 # noinspection SpellCheckingInspection
-@pytest.mark.parametrize(
-    "reason, expected",
-    [
-        # classic examples using the default domain (Python)
-        ("Use :func:`bar` instead", "Use `bar` instead"),
-        ("Use :function:`bar` instead", "Use `bar` instead"),
-        ("Use :class:`Baz` instead", "Use `Baz` instead"),
-        ("Use :exc:`Baz` instead", "Use `Baz` instead"),
-        ("Use :exception:`Baz` instead", "Use `Baz` instead"),
-        ("Use :meth:`Baz.bar` instead", "Use `Baz.bar` instead"),
-        ("Use :method:`Baz.bar` instead", "Use `Baz.bar` instead"),
-        # other examples using a domain :
-        ("Use :py:func:`bar` instead", "Use `bar` instead"),
-        ("Use :cpp:func:`bar` instead", "Use `bar` instead"),
-        ("Use :js:func:`bar` instead", "Use `bar` instead"),
-        # the reference can have special characters:
-        ("Use :func:`~pkg.mod.bar` instead", "Use `~pkg.mod.bar` instead"),
-        # edge cases:
-        ("Use :r:`` instead", "Use `` instead"),
-        ("Use :d:r:`` instead", "Use `` instead"),
-        ("Use :r:`foo` instead", "Use `foo` instead"),
-        ("Use :d:r:`foo` instead", "Use `foo` instead"),
-        ("Use r:`bad` instead", "Use r:`bad` instead"),
-        ("Use ::`bad` instead", "Use ::`bad` instead"),
-        ("Use :::`bad` instead", "Use :::`bad` instead"),
-    ],
-)
-def test_get_deprecat_msg(reason, expected):
-    adapter = deprecat.sphinx.SphinxAdapter("deprecated", reason=reason, version="1")
-    actual = adapter.get_deprecated_msg(lambda: None, None, None)
-    assert expected in list(actual.values())[0]
\ No newline at end of file
+_TRIM_CASES = [
+    # classic examples using the default domain (Python)
+    ("Use :func:`bar` instead", "Use `bar` instead"),
+    ("Use :function:`bar` instead", "Use `bar` instead"),
+    ("Use :class:`Baz` instead", "Use `Baz` instead"),
+    ("Use :exc:`Baz` instead", "Use `Baz` instead"),
+    ("Use :exception:`Baz` instead", "Use `Baz` instead"),
+    ("Use :meth:`Baz.bar` instead", "Use `Baz.bar` instead"),
+    ("Use :method:`Baz.bar` instead", "Use `Baz.bar` instead"),
+    # other examples using a domain :
+    ("Use :py:func:`bar` instead", "Use `bar` instead"),
+    ("Use :cpp:func:`bar` instead", "Use `bar` instead"),
+    ("Use :js:func:`bar` instead", "Use `bar` instead"),
+    # the reference can have special characters:
+    ("Use :func:`~pkg.mod.bar` instead", "Use `~pkg.mod.bar` instead"),
+    # edge cases:
+    ("Use :r:`` instead", "Use `` instead"),
+    ("Use :d:r:`` instead", "Use `` instead"),
+    ("Use :r:`foo` instead", "Use `foo` instead"),
+    ("Use :d:r:`foo` instead", "Use `foo` instead"),
+    ("Use r:`bad` instead", "Use r:`bad` instead"),
+    ("Use ::`bad` instead", "Use ::`bad` instead"),
+    ("Use :::`bad` instead", "Use :::`bad` instead"),
+]
+
+
+def test_get_deprecat_msg():
+    # One table-driven item instead of a pytest Item per row: the cases
+    # share their setup and just exercise a pure string transformation.
+    for reason, expected in _TRIM_CASES:
+        adapter = _sphinx_adapter("deprecated", reason, "1")
+        actual = adapter.get_deprecated_msg(lambda: None, None, None)
+        assert expected in actual, f"case {reason!r}"
\ No newline at end of file